@@ -33,16 +33,20 @@ from __future__ import annotations
 import logging
 from types import TracebackType
 from typing import Self, Literal
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from abc import ABC, abstractmethod
 from time import sleep
+from weakref import finalize
 import socket
 
 from serial import (
     Serial,
+    SerialException,
     PARITY_NONE
 )
+from serial.serialutil import Timeout
 
 
 def get_dummy_logger(name: str = "geocompy.dummy") -> logging.Logger:
@@ -72,6 +76,119 @@ DUMMYLOGGER = get_dummy_logger()
 """Dummy logger instance to use when no logger is actually needed."""
 
 
+def _to_bytes(value: bytes | str) -> bytes:
+    """
+    Converts a message terminator sequence to bytes.
+
+    Parameters
+    ----------
+    value : bytes | str
+        Terminator sequence as bytes or ASCII string.
+
+    Returns
+    -------
+    bytes
+        Terminator sequence.
+    """
+    if isinstance(value, str):
+        return value.encode("ascii")
+
+    return bytes(value)
+
+
+def _encode_messages(
+    messages: Iterable[str],
+    eom: bytes
+) -> tuple[bytearray, int]:
+    """
+    Encodes multiple messages into a single payload, appending the
+    EndOfMessage sequence to each message where it is missing.
+
+    Parameters
+    ----------
+    messages : Iterable[str]
+        Messages to encode.
+    eom : bytes
+        EndOfMessage sequence.
+
+    Returns
+    -------
+    tuple[bytearray, int]
+        Encoded payload and number of messages.
+
+    Raises
+    ------
+    UnicodeEncodeError
+        If a message contains non-ASCII characters.
+    """
+    payload = bytearray()
+    count = 0
+    for message in messages:
+        data = message.encode("ascii")
+        payload += data
+        if not data.endswith(eom):
+            payload += eom
+
+        count += 1
+
+    return payload, count
+
+
+class _FrameAccumulator:
+    """
+    Splits a stream of received data into frames, separated by a
+    terminator sequence.
+
+    Only the newly fed bytes (and the last few bytes before them, that
+    might be the beginning of a split terminator) are searched for the
+    terminator, so the scanning cost is proportional to the new data,
+    not the size of the buffered incomplete frame.
+    """
+
+    def __init__(self, terminator: bytes):
+        """
+        Parameters
+        ----------
+        terminator : bytes
+            Frame terminator sequence.
+        """
+        self._terminator: bytes = terminator
+        self._buffer: bytearray = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        Appends a chunk of received data, and splits off all complete
+        frames.
+
+        Parameters
+        ----------
+        chunk : bytes
+            Received data.
+
+        Returns
+        -------
+        list[bytes]
+            Complete frames without the terminator (empty if no frame
+            was completed by the chunk).
+        """
+        buffer = self._buffer
+        terminator = self._terminator
+        start = max(len(buffer) - len(terminator) + 1, 0)
+        buffer += chunk
+        if buffer.find(terminator, start) == -1:
+            return []
+
+        *frames, rest = bytes(buffer).split(terminator)
+        buffer[:] = rest
+        return frames
+
+    def clear(self) -> None:
+        """
+        Discards the buffered incomplete frame.
+        """
+        self._buffer.clear()
+
+
 class Connection(ABC):
     """
     Interface definition for connection implementations.
@@ -113,10 +230,11 @@ def open_serial(
     stopbits: int = 1,
     parity: str = PARITY_NONE,
     timeout: int = 15,
-    eom: str = "\r\n",
-    eoa: str = "\r\n",
+    eom: bytes | str = "\r\n",
+    eoa: bytes | str = "\r\n",
     sync_after_timeout: bool = False,
     attempts: int = 1,
+    low_latency: bool = False,
     logger: logging.Logger | None = None
 ) -> SerialConnection:
     """
@@ -137,15 +255,19 @@ def open_serial(
         Parity bit behavior, by default PARITY_NONE
     timeout : int, optional
         Communication timeout threshold, by default 15
-    eom : str, optional
+    eom : bytes | str, optional
         EndOfMessage sequence, by default ``"\\r\\n"``
-    eoa : str, optional
+    eoa : bytes | str, optional
         EndOfAnswer sequence, by default ``"\\r\\n"``
     sync_after_timeout : bool, optional
         Attempt to re-sync the message-response que, if a timeout
         occured in the previous exchange, by default False
     attempts : int, optional
         Number of attempts at opening the connection, by default 1
+    low_latency : bool, optional
+        Enable the low latency mode of the serial driver, to avoid the
+        buffering delay of USB adapters (only supported on Linux),
+        by default False
     logger : logging.Logger | None, optional
         Logger instance to use to log connection related events. Defaults
         to a dummy logger when not specified, by default None
@@ -186,9 +308,9 @@ def open_serial(
         f"Connection parameters: "
         f"baud={speed:d}, timeout={timeout:d}, "
         f"sync_after_timeout={str(sync_after_timeout)}, "
-        f"attempts={attempts:d}, "
+        f"attempts={attempts:d}, low_latency={str(low_latency)}, "
         f"databits={databits:d}, stopbits={stopbits:d}, parity={parity}, "
-        f"eom={eom.encode('ascii')!r}, eoa={eoa.encode('ascii')!r}"
+        f"eom={_to_bytes(eom)!r}, eoa={_to_bytes(eoa)!r}"
     )
     for i in range(max(attempts, 1)):
         try:
@@ -204,11 +326,22 @@ def open_serial(
     else:
         raise ConnectionRefusedError("Could not open connection")
 
+    if low_latency:
+        # The low latency mode is only implemented in the POSIX port
+        # of pyserial, and it only works with supporting drivers.
+        try:
+            serialport.set_low_latency_mode(  # type: ignore[attr-defined]
+                True
+            )
+        except Exception:
+            logger.warning("Could not enable low latency mode")
+
     wrapper = SerialConnection(
         serialport,
         eom=eom,
         eoa=eoa,
         sync_after_timeout=sync_after_timeout,
+        owns_port=True,
         logger=logger
     )
     return wrapper
@@ -220,8 +353,8 @@ def open_socket(
     protocol: Literal['rfcomm', 'tcp'],
     *,
     timeout: int = 15,
-    eom: str = "\r\n",
-    eoa: str = "\r\n",
+    eom: bytes | str = "\r\n",
+    eoa: bytes | str = "\r\n",
     sync_after_timeout: bool = False,
     attempts: int = 1,
     logger: logging.Logger | None = None
@@ -240,9 +373,9 @@ def open_socket(
         Protocol to use for connection.
     timeout : int, optional
         Communication timeout threshold, by default 15
-    eom : str, optional
+    eom : bytes | str, optional
         EndOfMessage sequence, by default ``"\\r\\n"``
-    eoa : str, optional
+    eoa : bytes | str, optional
         EndOfAnswer sequence, by default ``"\\r\\n"``
     sync_after_timeout : bool, optional
         Attempt to re-sync the message-response que, if a timeout
@@ -292,7 +425,7 @@ def open_socket(
         f"timeout={timeout:d}, "
         f"sync_after_timeout={str(sync_after_timeout)}, "
         f"attempts={attempts:d}, "
-        f"eom={eom.encode('ascii')!r}, eoa={eoa.encode('ascii')!r}"
+        f"eom={_to_bytes(eom)!r}, eoa={_to_bytes(eoa)!r}"
     )
     match protocol:
         case "rfcomm":
@@ -387,8 +520,8 @@ class SocketConnection(Connection):
         self,
         sock: socket.socket,
         *,
-        eom: str = "\r\n",
-        eoa: str = "\r\n",
+        eom: bytes | str = "\r\n",
+        eoa: bytes | str = "\r\n",
         sync_after_timeout: bool = False,
         logger: logging.Logger | None = None
     ):
@@ -397,9 +530,9 @@ class SocketConnection(Connection):
         ----------
         sock : ~socket.socket
             Socket communicate on.
-        eom : str, optional
+        eom : bytes | str, optional
             EndOfMessage sequence, by default ``"\\r\\n"``
-        eoa : str, optional
+        eoa : bytes | str, optional
             EndOfAnswer sequence, by default ``"\\r\\n"``
         sync_after_timeout : bool, optional
             Attempt to re-sync the message-response que, if a timeout
@@ -423,15 +556,14 @@ class SocketConnection(Connection):
 
         """
         self.socket = sock
-        self.eom: str = eom  # end of message
-        self.eombytes: bytes = eom.encode("ascii")
-        self.eoa: str = eoa  # end of answer
-        self.eoabytes: bytes = eoa.encode("ascii")
+        self.eombytes: bytes = _to_bytes(eom)  # end of message
+        self.eoabytes: bytes = _to_bytes(eoa)  # end of answer
         self._attempt_sync: bool = sync_after_timeout
         self._timeout_counter: int = 0
         self._logger: logging.Logger = logger or DUMMYLOGGER
 
-        self._receiver_buffer: bytes = b""
+        self._frames: _FrameAccumulator = _FrameAccumulator(self.eoabytes)
+        self._pending: deque[bytes] = deque()
         self._chunk = 1024
 
     def __enter__(self) -> Self:
@@ -445,6 +577,16 @@ class SocketConnection(Connection):
     ) -> None:
         self.close()
 
+    @property
+    def eom(self) -> str:
+        """EndOfMessage sequence."""
+        return self.eombytes.decode("ascii")
+
+    @property
+    def eoa(self) -> str:
+        """EndOfAnswer sequence."""
+        return self.eoabytes.decode("ascii")
+
     def is_open(self) -> bool:
         """
         Checks if the socket currently open and connected.
@@ -470,6 +612,23 @@ class SocketConnection(Connection):
         data : bytes
             Data to send.
 
+        Raises
+        ------
+        ConnectionError
+            The socket is not connected or closed to writing.
+        """
+        self._write_message(data)
+
+    def _write_message(self, data: bytes | bytearray) -> None:
+        """
+        Sends a single message through the socket, and appends the
+        EndOfMessage sequence if it is missing.
+
+        Parameters
+        ----------
+        data : bytes | bytearray
+            Data to send.
+
         Raises
         ------
         ConnectionError
@@ -479,7 +638,7 @@ class SocketConnection(Connection):
             data += self.eombytes
 
         try:
-            self.socket.send(data)
+            self.socket.sendall(data)
         except Exception as e:
             raise ConnectionError(
                 "Cannot send data, socket most likely disconnected"
@@ -498,31 +657,42 @@ class SocketConnection(Connection):
         ------
         ConnectionError
             The socket is not connected or closed to writing.
+        UnicodeEncodeError
+            If the message contains non-ASCII characters.
         """
-        self.send_binary(message.encode("ascii", "ignore"))
+        self.send_binary(message.encode("ascii"))
 
     def _receive_chunked(self) -> bytes:
         """
         Receives a binary data block from the socket.
 
         Handles the potential chunked reading of the data with an internal
-        receiver buffer.
+        frame accumulator. If multiple complete answers were received at
+        once, the extra ones are queued, and returned by the following
+        calls without touching the socket.
 
         Returns
         -------
         bytes
             Received data.
         """
-        while self.eoabytes not in self._receiver_buffer:
-            data = self.socket.recv(self._chunk)
-            self._receiver_buffer += data
+        pending = self._pending
+        if pending:
+            return pending.popleft()
+
+        sock = self.socket
+        frames = self._frames
+        while True:
+            chunk = sock.recv(self._chunk)
+            if not chunk:
+                raise ConnectionError("socket was closed by the remote end")
 
-        end = self._receiver_buffer.index(self.eoabytes)
-        data = self._receiver_buffer[:end]
-        self._receiver_buffer = self._receiver_buffer[
-            end + len(self.eoabytes):
-        ]
-        return data
+            answers = frames.feed(chunk)
+            if answers:
+                break
+
+        pending.extend(answers[1:])
+        return answers[0]
 
     def receive_binary(self) -> bytes:
         """
@@ -634,12 +804,53 @@ class SocketConnection(Connection):
             The socket is not connected or closed to writing or reading.
         TimeoutError
             Data was not received within the timeout period.
+        UnicodeEncodeError
+            If the message contains non-ASCII characters.
 
         """
         return self.exchange_binary(
-            cmd.encode("ascii", "ignore")
+            cmd.encode("ascii")
         ).decode("ascii")
 
+    def exchange_pipelined(self, cmds: Iterable[str]) -> list[str]:
+        """
+        Sends multiple messages through the socket at once, and receives
+        the corresponding responses.
+
+        Parameters
+        ----------
+        cmds : Iterable[str]
+            Messages to send.
+
+        Returns
+        -------
+        list[str]
+            Responses to the sent messages, in the order of the messages.
+
+        Raises
+        ------
+        ConnectionError
+            The socket is not connected or closed to writing or reading.
+        TimeoutError
+            Data was not received within the timeout period.
+        UnicodeEncodeError
+            If the message contains non-ASCII characters.
+
+        Warning
+        -------
+
+        All messages are sent before the first response is received. The
+        remote end has to buffer the incoming messages, and answer them in
+        order. Otherwise the responses might be lost or mixed up.
+
+        """
+        payload, count = _encode_messages(cmds, self.eombytes)
+        if not count:
+            return []
+
+        self._write_message(payload)
+        return [self.receive() for _ in range(count)]
+
     def close(self) -> None:
         """
         Shuts down and closes the socket.
@@ -680,7 +891,8 @@ class SocketConnection(Connection):
         self.socket.close()
         self.socket = newsoc
         self.socket.connect(address)
-        self._receiver_buffer = b""
+        self._frames.clear()
+        self._pending.clear()
         self._timeout_counter = 0
         self._logger.debug("Reset connection")
 
@@ -778,9 +990,10 @@ class SerialConnection(Connection):
         self,
         port: Serial,
         *,
-        eom: str = "\r\n",
-        eoa: str = "\r\n",
+        eom: bytes | str = "\r\n",
+        eoa: bytes | str = "\r\n",
         sync_after_timeout: bool = False,
+        owns_port: bool = False,
         logger: logging.Logger | None = None
     ):
         """
@@ -788,13 +1001,16 @@ class SerialConnection(Connection):
         ----------
         port : Serial
             Serial port to communicate on.
-        eom : str, optional
+        eom : bytes | str, optional
             EndOfMessage sequence, by default ``"\\r\\n"``
-        eoa : str, optional
+        eoa : bytes | str, optional
             EndOfAnswer sequence, by default ``"\\r\\n"``
         sync_after_timeout : bool, optional
             Attempt to re-sync the message-response que, if a timeout
             occured in the previous exchange, by default False
+        owns_port : bool, optional
+            Close the serial port when the connection object is garbage
+            collected, by default False
         logger : logging.Logger | None, optional
             Logger instance to use to log connection related events. Defaults
             to a dummy logger when not specified, by default None
@@ -805,6 +1021,10 @@ class SerialConnection(Connection):
         attempted. This might raise an exception if the port cannot
         be opened.
 
+        The serial port is owned by the caller, that passed it, unless
+        `owns_port` is set. A port not owned by the connection is only
+        closed by an explicit `close` call (or at the end of a context).
+
         Warning
         -------
 
@@ -821,19 +1041,20 @@ class SerialConnection(Connection):
         """
 
         self._port: Serial = port
-        self.eom: str = eom  # end of message
-        self.eombytes: bytes = eom.encode("ascii")
-        self.eoa: str = eoa  # end of answer
-        self.eoabytes: bytes = eoa.encode("ascii")
+        self.eombytes: bytes = _to_bytes(eom)  # end of message
+        self.eoabytes: bytes = _to_bytes(eoa)  # end of answer
         self._attempt_sync: bool = sync_after_timeout
         self._timeout_counter: int = 0
         self._logger: logging.Logger = logger or DUMMYLOGGER
 
+        self._frames: _FrameAccumulator = _FrameAccumulator(self.eoabytes)
+        self._pending: deque[bytes] = deque()
+
         if not self._port.is_open:
             self._port.open()
 
-    def __del__(self) -> None:
-        self._port.close()
+        if owns_port:
+            finalize(self, port.close)
 
     def __enter__(self) -> Self:
         return self
@@ -846,11 +1067,23 @@ class SerialConnection(Connection):
     ) -> None:
         self.close()
 
+    @property
+    def eom(self) -> str:
+        """EndOfMessage sequence."""
+        return self.eombytes.decode("ascii")
+
+    @property
+    def eoa(self) -> str:
+        """EndOfAnswer sequence."""
+        return self.eoabytes.decode("ascii")
+
     def close(self) -> None:
         """
         Closes the serial port.
         """
         self._port.close()
+        self._frames.clear()
+        self._pending.clear()
         self._logger.info(f"Closed connection on {self._port.port}")
 
     def is_open(self) -> bool:
@@ -880,15 +1113,7 @@ class SerialConnection(Connection):
             If the serial port is not open.
 
         """
-        if not self._port.is_open:
-            raise ConnectionError(
-                "serial port is not open"
-            )
-
-        if not data.endswith(self.eombytes):
-            data += self.eombytes
-
-        self._port.write(data)
+        self._write_message(data)
 
     def send(self, message: str) -> None:
         """
@@ -903,9 +1128,85 @@ class SerialConnection(Connection):
         ------
         ConnectionError
             If the serial port is not open.
+        UnicodeEncodeError
+            If the message contains non-ASCII characters.
+
+        """
+        self._write_message(message.encode("ascii"))
+
+    def _write_message(self, data: bytes | bytearray) -> None:
+        """
+        Writes a single message to the serial line, and appends the
+        EndOfMessage sequence if it is missing.
+
+        Parameters
+        ----------
+        data : bytes | bytearray
+            Data to send.
+
+        Raises
+        ------
+        ConnectionError
+            If the serial port is not open.
+        """
+        if not data.endswith(self.eombytes):
+            data += self.eombytes
 
+        try:
+            self._port.write(data)
+        except SerialException as e:
+            raise ConnectionError(
+                "Cannot send data, serial port is most likely closed"
+            ) from e
+
+    def _receive_chunked(self) -> bytes:
         """
-        self.send_binary(message.encode("ascii", "ignore"))
+        Reads a binary data block from the serial line.
+
+        Instead of reading byte-by-byte, all bytes already waiting in the
+        input buffer are read at once (or a single byte is waited for, if
+        the buffer is empty). Only the newly read bytes are searched for
+        the EndOfAnswer sequence. If multiple complete answers were read
+        at once, the extra ones are queued, and returned by the following
+        calls without touching the port. Incomplete data is kept in an
+        internal frame accumulator for the next call.
+
+        The timeout of the port applies to the whole answer, not just the
+        individual reads (same as with `Serial.read_until`).
+
+        Returns
+        -------
+        bytes
+            Received data.
+
+        Raises
+        ------
+        TimeoutError
+            If the connection timed out before receiving the
+            EndOfAnswer sequence.
+        """
+        pending = self._pending
+        if pending:
+            return pending.popleft()
+
+        port = self._port
+        frames = self._frames
+        # None (blocking port) is accepted at runtime as an infinite timeout
+        timeout = Timeout(port.timeout)  # type: ignore[arg-type]
+        while True:
+            chunk = port.read(max(port.in_waiting, 1))
+            if not chunk:
+                raise TimeoutError()
+
+            answers = frames.feed(chunk)
+            if answers:
+                break
+
+            if timeout.expired():
+                raise TimeoutError()
+
+        pending.extend(answers[1:])
+        return answers[0]
 
     def receive_binary(self) -> bytes:
         """
@@ -925,32 +1226,56 @@ class SerialConnection(Connection):
             EndOfAnswer sequence.
 
         """
-        if not self._port.is_open:
-            raise ConnectionError(
-                "serial port is not open"
-            )
+        return self._read_answer()
+
+    def _read_answer(self) -> bytes:
+        """
+        Reads a single answer from the serial line. If que syncing is
+        enabled, the late answers of previously timed out exchanges are
+        discarded first.
 
-        eoabytes = self.eoabytes
+        Returns
+        -------
+        bytes
+            Received data.
+
+        Raises
+        ------
+        ConnectionError
+            If the serial port is not open.
+        TimeoutError
+            If the connection timed out before receiving the
+            EndOfAnswer sequence.
+        """
         if self._attempt_sync and self._timeout_counter > 0:
             for _ in range(self._timeout_counter):
-                excess = self._port.read_until(eoabytes)
-                if not excess.endswith(eoabytes):
+                try:
+                    self._receive_chunked()
+                except TimeoutError as te:
                     self._timeout_counter += 1
                     raise TimeoutError(
                         "Serial connection timed out on 'receive_binary' "
                         "during an attempt to recover from a previous timeout"
-                    )
+                    ) from te
+                except Exception as e:
+                    raise ConnectionError(
+                        "Cannot receive data, serial port is most likely "
+                        "closed"
+                    ) from e
             else:
                 self._timeout_counter = 0
 
-        answer = self._port.read_until(eoabytes)
-        if not answer.endswith(eoabytes):
+        try:
+            return self._receive_chunked()
+        except TimeoutError as te:
             self._timeout_counter += 1
             raise TimeoutError(
                 "serial connection timed out on 'receive_binary'"
-            )
-
-        return answer.removesuffix(eoabytes)
+            ) from te
+        except Exception as e:
+            raise ConnectionError(
+                "Cannot receive data, serial port is most likely closed"
+            ) from e
 
     def receive(self) -> str:
         """
@@ -971,7 +1296,7 @@ class SerialConnection(Connection):
 
         """
 
-        return self.receive_binary().decode("ascii")
+        return self._read_answer().decode("ascii")
 
     def exchange_binary(self, data: bytes) -> bytes:
         """
@@ -997,8 +1322,8 @@ class SerialConnection(Connection):
             EndOfAnswer sequence for one of the responses.
 
         """
-        self.send_binary(data)
-        return self.receive_binary()
+        self._write_message(data)
+        return self._read_answer()
 
     def exchange(self, cmd: str) -> str:
         """
@@ -1022,11 +1347,52 @@ class SerialConnection(Connection):
         TimeoutError
             If the connection timed out before receiving the
             EndOfAnswer sequence for one of the responses.
+        UnicodeEncodeError
+            If the message contains non-ASCII characters.
 
         """
-        return self.exchange_binary(
-            cmd.encode("ascii", "ignore")
-        ).decode("ascii")
+        self._write_message(cmd.encode("ascii"))
+        return self._read_answer().decode("ascii")
+
+    def exchange_pipelined(self, cmds: Iterable[str]) -> list[str]:
+        """
+        Writes multiple messages to the serial line at once, and receives
+        the corresponding responses.
+
+        Parameters
+        ----------
+        cmds : Iterable[str]
+            Messages to send.
+
+        Returns
+        -------
+        list[str]
+            Responses to the sent messages, in the order of the messages.
+
+        Raises
+        ------
+        ConnectionError
+            If the serial port is not open.
+        TimeoutError
+            If the connection timed out before receiving the
+            EndOfAnswer sequence for one of the responses.
+        UnicodeEncodeError
+            If the message contains non-ASCII characters.
+
+        Warning
+        -------
+
+        The instrument has to be able to hold all messages in its input
+        buffer. Messages overflowing the buffer are lost, and the exchange
+        times out waiting for their responses.
+
+        """
+        payload, count = _encode_messages(cmds, self.eombytes)
+        if not count:
+            return []
+
+        self._write_message(payload)
+        return [self._read_answer().decode("ascii") for _ in range(count)]
 
     def reset(self) -> None:
         """
@@ -1044,6 +1410,8 @@ class SerialConnection(Connection):
         """
         self._port.reset_input_buffer()
         self._port.reset_output_buffer()
+        self._frames.clear()
+        self._pending.clear()
         self._timeout_counter = 0
         self._logger.debug("Reset connection")
 
@@ -25,10 +25,10 @@ Types
 """
 from __future__ import annotations
 
-import re
 import math
 from enum import Enum
 from typing import (
+    cast,
     Literal,
     TypeVar,
     Self,
@@ -48,6 +48,14 @@ PI2 = 2 * math.pi
 """Full angle in RAD"""
 
 _E = TypeVar("_E", bound=Enum)
+_NUMERIC = (int, float)
+_BYTE_STR = tuple(f"'{i:02X}'" for i in range(256))
+_BYTE_FROM_HEX = (
+    {f"{i:02X}": i for i in range(256)}
+    | {f"{i:02x}": i for i in range(256)}
+)
+# Parsers already created by get_enum_parser, keyed by the target enum
+_ENUM_PARSERS: dict[type[Enum], Callable[[str], Any]] = {}
 
 
 def parse_string(value: str) -> str:
@@ -92,6 +100,13 @@ def parse_bool(value: str) -> bool:
     bool
         Parsed boolean.
     """
+    # The instruments send "0" or "1" for boolean values, other integer
+    # representations are only parsed as a fallback.
+    if value == "1":
+        return True
+    elif value == "0":
+        return False
+
     return bool(int(value))
 
 
@@ -127,16 +142,16 @@ def get_enum(e: type[_E], value: _E | str) -> _E:
     >>> gc.data.get_enum(MyEnum, MyEnum.TWO)
     <MyEnum.TWO: 2>
     """
+    if isinstance(value, e):
+        return value
+
     if isinstance(value, str):
         return e[value]
 
-    if value not in e:
-        raise ValueError(
-            f"given member ({value}) is not a member "
-            f"of the target enum: {e}"
-        )
-
-    return value
+    raise ValueError(
+        f"given member ({value}) is not a member "
+        f"of the target enum: {e}"
+    )
 
 
 def get_enum_parser(e: type[_E]) -> Callable[[str], _E]:
@@ -169,12 +184,68 @@ def get_enum_parser(e: type[_E]) -> Callable[[str], _E]:
     <MyEnum.ONE: 1>
 
     """
-    def parser(value: str) -> _E:
-        return e(int(value))
-
+    cached = _ENUM_PARSERS.get(e)
+    if cached is not None:
+        return cast(Callable[[str], _E], cached)
+
+    # Members are looked up directly by their serialized value, to avoid
+    # the overhead of the integer conversion and the enum call machinery.
+    # Other inputs (e.g. zero padded values) fall back to the enum call,
+    # so the result or error (and any custom _missing_ handling) stays the
+    # same. The lookup table and enum type are bound as default arguments,
+    # so they are accessed as fast local variables instead of closure cells.
+    members: dict[str, _E] = {str(member.value): member for member in e}
+
+    def parser(
+        value: str,
+        _members: dict[str, _E] = members,
+        _e: type[_E] = e
+    ) -> _E:
+        member = _members.get(value)
+        if member is None:
+            return _e(int(value))
+
+        return member
+
+    _ENUM_PARSERS[e] = parser
     return parser
 
 
+def _as_float(value: Any) -> float | None:
+    """
+    Returns the float value of an arithmetic operand.
+
+    The conversion is attempted directly, instead of checking against the
+    `SupportsFloat` protocol, as runtime protocol checks are slow.
+
+    Parameters
+    ----------
+    value : Any
+        Operand to convert.
+
+    Returns
+    -------
+    float | None
+        Float value, or None if the operand does not support the
+        conversion.
+    """
+    if type(value) is float:
+        return value
+
+    # Angle-Angle arithmetic is the most common non-float case, the
+    # radian value can be read directly without the method call.
+    if type(value) is Angle:
+        return value._value
+
+    if isinstance(value, _NUMERIC):
+        return float(value)
+
+    try:
+        return value.__float__()  # type: ignore[no-any-return]
+    except AttributeError:
+        return None
+
+
 _AngleUnit = Literal['deg', 'rad', 'gon']
 
 
@@ -191,6 +262,7 @@ class Angle:
     represented in radians.
 
     """
+    __slots__ = ("_value",)
 
     @staticmethod
     def deg2rad(angle: float) -> float:
@@ -208,21 +280,42 @@ class Angle:
     def dms2rad(dms: str) -> float:
         """Converts DDD-MM-SS to radians.
         """
-        if not re.search(r"^-?[0-9]{1,3}(-[0-9]{1,2}){0,2}(\.\d+)?$", dms):
-            raise ValueError("Angle invalid argument", dms)
-
         if dms.startswith("-"):
             sign = -1
-            dms = dms[1:]
+            body = dms[1:]
         else:
             sign = 1
+            body = dms
+
+        parts = body.split("-")
+        whole, dot, fraction = parts[-1].partition(".")
+        if len(parts) > 3 or (
+            dot and not (fraction.isascii() and fraction.isdigit())
+        ):
+            raise ValueError("Angle invalid argument", dms)
 
-        items = [float(item) for item in dms.split("-")]
-        div = 1
-        a = 0.0
-        for val in items:
-            a += val / div
-            div *= 60
+        maxlength = 3
+        for part in parts[:-1] + [whole]:
+            if not (
+                part.isascii()
+                and part.isdigit()
+                and len(part) <= maxlength
+            ):
+                raise ValueError("Angle invalid argument", dms)
+
+            maxlength = 2
+
+        match len(parts):
+            case 1:
+                a = float(parts[0])
+            case 2:
+                a = int(parts[0]) + float(parts[1]) / 60
+            case _:
+                a = (
+                    int(parts[0])
+                    + int(parts[1]) / 60
+                    + float(parts[2]) / 3600
+                )
 
         return math.radians(a) * sign
 
@@ -243,6 +336,13 @@ class Angle:
         """Converts radians to DDD-MM-SS.
         """
         signum = "-" if angle < 0 else ""
+        if precision == 0:
+            # Whole seconds are handled with integer arithmetic.
+            isecs = round(abs(angle) * RO)
+            imi, isec = isecs // 60, isecs % 60
+            ideg, imi = imi // 60, imi % 60
+            return f"{signum:s}{ideg:d}-{imi:02d}-{isec:02d}"
+
         secs = round(abs(angle) * RO, precision)
         mi, sec = divmod(secs, 60)
         deg, mi = divmod(int(mi), 60)
@@ -296,15 +396,11 @@ class Angle:
         ValueError
             If an unknown `unit` was passed.
         """
-        match unit:
-            case 'deg':
-                rad = self.deg2rad(value)
-            case 'rad':
-                rad = float(value)
-            case 'gon':
-                rad = self.gon2rad(value)
-            case _:
-                raise ValueError(f"unknown source unit: '{unit}'")
+        convert = _ANGLE_TO_RAD.get(unit)
+        if convert is None:
+            raise ValueError(f"unknown source unit: '{unit}'")
+
+        rad = convert(value)
 
         if normalize:
             exp, rad = divmod(rad, PI2)
@@ -314,6 +410,16 @@ class Angle:
 
         self._value: float = rad
 
+    @classmethod
+    def _from_rad(cls, value: float) -> Self:
+        """
+        Creates a new instance directly from a radian value, without
+        unit conversion and normalization.
+        """
+        angle = cls.__new__(cls)
+        angle._value = value
+        return angle
+
     @classmethod
     def from_dms(cls, value: str) -> Angle:
         """
@@ -343,46 +449,55 @@ class Angle:
         return format(self._value, format_spec)
 
     def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return False
 
-        return self._value == float(other)
+        return self._value == value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
 
     def __gt__(self, other: SupportsFloat) -> bool:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return float(self) > float(other)
+        return float(self) > value
 
     def __lt__(self, other: SupportsFloat) -> bool:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return float(self) < float(other)
+        return float(self) < value
 
     def __ge__(self, other: SupportsFloat) -> bool:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return float(self) >= float(other)
+        return float(self) >= value
 
     def __le__(self, other: SupportsFloat) -> bool:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return float(self) <= float(other)
+        return float(self) <= value
 
     def __pos__(self) -> Self:
-        return type(self)(self._value)
+        return self._from_rad(self._value)
 
     def __neg__(self) -> Self:
-        return type(self)(-self._value)
+        return self._from_rad(-self._value)
 
     def __add__(self, other: SupportsFloat) -> Self:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return type(self)(self._value + float(other))
+        return self._from_rad(self._value + value)
 
     def __radd__(self, other: SupportsFloat) -> Self:
         return self + other
@@ -391,25 +506,28 @@ class Angle:
         return self + other
 
     def __sub__(self, other: SupportsFloat) -> Self:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return type(self)(self._value - float(other))
+        return self._from_rad(self._value - value)
 
     def __rsub__(self, other: SupportsFloat) -> Self:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return type(self)(float(other) - self._value)
+        return self._from_rad(value - self._value)
 
     def __isub__(self, other: SupportsFloat) -> Self:
         return self - other
 
     def __mul__(self, other: SupportsFloat) -> Self:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return type(self)(self._value * float(other))
+        return self._from_rad(self._value * value)
 
     def __rmul__(self, other: SupportsFloat) -> Self:
         return self * other
@@ -418,31 +536,35 @@ class Angle:
         return self * other
 
     def __truediv__(self, other: SupportsFloat) -> Self:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return type(self)(self._value / float(other))
+        return self._from_rad(self._value / value)
 
     def __rtruediv__(self, other: SupportsFloat) -> float:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return float(other) / self._value
+        return value / self._value
 
     def __itruediv__(self, other: SupportsFloat) -> Self:
         return self / other
 
     def __floordiv__(self, other: SupportsFloat) -> Self:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return type(self)(self._value // float(other))
+        return self._from_rad(self._value // value)
 
     def __rfloordiv__(self, other: SupportsFloat) -> float:
-        if not isinstance(other, SupportsFloat):
+        value = _as_float(other)
+        if value is None:
             return NotImplemented
 
-        return float(other) // self._value
+        return value // self._value
 
     def __ifloordiv__(self, other: SupportsFloat) -> Self:
         return self // other
@@ -480,15 +602,11 @@ class Angle:
         ValueError
             If an unknown `unit` was passed
         """
-        match unit:
-            case 'deg':
-                return self.rad2deg(self._value)
-            case 'rad':
-                return self._value
-            case 'gon':
-                return self.rad2gon(self._value)
-            case _:
-                raise ValueError(f"unknown target unit: '{unit}'")
+        convert = _ANGLE_FROM_RAD.get(unit)
+        if convert is None:
+            raise ValueError(f"unknown target unit: '{unit}'")
+
+        return convert(self._value)
 
     def normalized(self, positive: bool = True) -> Self:
         """
@@ -533,11 +651,26 @@ class Angle:
 
         diff = float(self) - float(other)
         if diff > math.pi:
-            return type(self)(diff - PI2)
+            return self._from_rad(diff - PI2)
         elif diff < -math.pi:
-            return type(self)(diff + PI2)
+            return self._from_rad(diff + PI2)
+
+        return self._from_rad(diff)
 
-        return type(self)(diff)
+
+# Unit conversion dispatch tables of Angle. They are defined after the
+# class, so they can hold the plain conversion functions, instead of the
+# staticmethod wrappers from the class body.
+_ANGLE_TO_RAD: dict[str, Callable[[float], float]] = {
+    'deg': Angle.deg2rad,
+    'rad': float,
+    'gon': Angle.gon2rad
+}
+_ANGLE_FROM_RAD: dict[str, Callable[[float], float]] = {
+    'deg': Angle.rad2deg,
+    'rad': float,
+    'gon': Angle.rad2gon
+}
 
 
 class Byte:
@@ -562,6 +695,7 @@ class Byte:
     >>> b = gc.data.Byte.parse(value)
 
     """
+    __slots__ = ("_value",)
 
     def __init__(self, value: int):
         """
@@ -584,7 +718,7 @@ class Byte:
         self._value: int = value
 
     def __str__(self) -> str:
-        return f"'{format(self._value, '02X')[-2:]}'"
+        return _BYTE_STR[self._value]
 
     def __repr__(self) -> str:
         return str(self)
@@ -617,10 +751,21 @@ class Byte:
         if string[0] == string[-1] == "'":
             string = string[1:-1]
 
-        value = int(string, base=16)
+        value = _BYTE_FROM_HEX.get(string)
+        if value is None:
+            value = int(string, base=16)
+
         return cls(value)
 
 
+class _VectorIndexError(IndexError, ValueError):
+    """
+    Raised on out of range `Vector` indices. It is an `IndexError`
+    for sequence semantics, and a `ValueError` for backwards
+    compatibility.
+    """
+
+
 class Vector:
     """
     Type to represent a position or direction with 3D cartesian coordinates.
@@ -644,6 +789,7 @@ class Vector:
     3.0
 
     """
+    __slots__ = ("x", "y", "z")
 
     def __init__(self, x: float, y: float, z: float):
         """
@@ -668,14 +814,19 @@ class Vector:
         return str(self)
 
     def __iter__(self) -> Iterator[float]:
-        return iter([self.x, self.y, self.z])
+        return iter((self.x, self.y, self.z))
 
     def __getitem__(self, idx: int) -> float:
-        if idx < 0 or idx > 2:
-            raise ValueError(f"index out of valid 0-2 range, got: {idx}")
-
-        coords = (self.x, self.y, self.z)
-        return coords[idx]
+        if idx == 0 or idx == -3:
+            return self.x
+        elif idx == 1 or idx == -2:
+            return self.y
+        elif idx == 2 or idx == -1:
+            return self.z
+
+        raise _VectorIndexError(
+            f"vector index out of range, valid range is -3 to 2, got: {idx}"
+        )
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Vector):
@@ -702,41 +853,43 @@ class Vector:
         )
 
     def __add__(self, other: Vector | SupportsFloat) -> Self:
-        if isinstance(other, SupportsFloat):
-            v = float(other)
-            return type(self)(
-                self.x + v,
-                self.y + v,
-                self.z + v
-            )
-        elif isinstance(other, Vector):
+        if isinstance(other, Vector):
             return type(self)(
                 self.x + other.x,
                 self.y + other.y,
                 self.z + other.z
             )
 
-        return NotImplemented
+        v = _as_float(other)
+        if v is None:
+            return NotImplemented
+
+        return type(self)(
+            self.x + v,
+            self.y + v,
+            self.z + v
+        )
 
     def __iadd__(self, other: Vector | SupportsFloat) -> Self:
         return self + other
 
     def __sub__(self, other: Vector | SupportsFloat) -> Self:
-        if isinstance(other, SupportsFloat):
-            v = float(other)
-            return type(self)(
-                self.x - v,
-                self.y - v,
-                self.z - v
-            )
-        elif isinstance(other, Vector):
+        if isinstance(other, Vector):
             return type(self)(
                 self.x - other.x,
                 self.y - other.y,
                 self.z - other.z
             )
 
-        return NotImplemented
+        v = _as_float(other)
+        if v is None:
+            return NotImplemented
+
+        return type(self)(
+            self.x - v,
+            self.y - v,
+            self.z - v
+        )
 
     def __isub__(self, other: Vector | SupportsFloat) -> Self:
         return self - other
@@ -748,15 +901,16 @@ class Vector:
                 self.y * other.y,
                 self.z * other.z
             )
-        elif isinstance(other, SupportsFloat):
-            v = float(other)
-            return type(self)(
-                self.x * v,
-                self.y * v,
-                self.z * v
-            )
 
-        return NotImplemented
+        v = _as_float(other)
+        if v is None:
+            return NotImplemented
+
+        return type(self)(
+            self.x * v,
+            self.y * v,
+            self.z * v
+        )
 
     def __rmul__(self, other: Vector | SupportsFloat) -> Self:
         return self * other
@@ -771,15 +925,16 @@ class Vector:
                 self.y / other.y,
                 self.z / other.z
             )
-        elif isinstance(other, SupportsFloat):
-            v = float(other)
-            return type(self)(
-                self.x / v,
-                self.y / v,
-                self.z / v
-            )
 
-        return NotImplemented
+        v = _as_float(other)
+        if v is None:
+            return NotImplemented
+
+        return type(self)(
+            self.x / v,
+            self.y / v,
+            self.z / v
+        )
 
     def __itruediv__(self, other: Vector | SupportsFloat) -> Self:
         return self / other
@@ -793,15 +948,7 @@ class Vector:
         float
             Length of the vector.
         """
-        return math.sqrt(
-            math.fsum(
-                (
-                    self.x**2,
-                    self.y**2,
-                    self.z**2
-                )
-            )
-        )
+        return math.hypot(self.x, self.y, self.z)
 
     def normalized(self) -> Self:
         """
@@ -988,6 +1135,7 @@ class Coordinate(Vector):
     3.0
 
     """
+    __slots__ = ()
 
     @property
     def e(self) -> float:
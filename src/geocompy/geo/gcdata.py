@@ -807,17 +807,17 @@ class EDMModeV1(EDMMode):
 
     ``EDM_MODE``
     """
-    SINGLE_STANDARD = 0,
+    SINGLE_STANDARD = 0
     """Standard single measurement."""
-    SINGLE_EXACT = 1,
+    SINGLE_EXACT = 1
     """Exact single measurement."""
-    SINGLE_FAST = 2,
+    SINGLE_FAST = 2
     """Fast single measurement."""
-    CONT_STANDARD = 3,
+    CONT_STANDARD = 3
     """Repeated measurement."""
-    CONT_EXACT = 4,
+    CONT_EXACT = 4
     """Repeated average measurement."""
-    CONT_FAST = 5,
+    CONT_FAST = 5
     """Fast repeated measurement."""
     UNDEFINED = 6
     """Not defined."""
@@ -208,15 +208,16 @@ class GsiOnlineDNA(GsiOnlineType):
             self._logger.exception("Error occured during SET request")
             answer = _UNKNOWNERROR
             comment = "EXCHANGE"
-        value = answer == "?"
-        if not value:
+
+        success = answer == "?"
+        if not success and not comment:
             comment = "INSTRUMENT"
 
         response = GsiOnlineResponse(
             param_descriptions.get(param, ""),
             cmd,
             answer,
-            value,
+            success,
             comment
         )
         self._logger.debug(response)
@@ -252,14 +253,14 @@ class GsiOnlineDNA(GsiOnlineType):
             answer = _UNKNOWNERROR
             comment = "EXCHANGE"
 
-        success = bool(self._CONFPAT.match(answer))
+        success = not comment and bool(self._CONFPAT.match(answer))
         value = None
         if success:
             try:
                 value = parser(answer.split("/")[1])
             except Exception:
                 comment = "PARSE"
-        else:
+        elif not comment:
             comment = "INSTRUMENT"
 
         response = GsiOnlineResponse(
@@ -299,15 +300,16 @@ class GsiOnlineDNA(GsiOnlineType):
             self._logger.exception("Error occured during PUT request")
             answer = _UNKNOWNERROR
             comment = "EXCHANGE"
-        value = answer == "?"
-        if not value:
+
+        success = answer == "?"
+        if not success and not comment:
             comment = "INSTRUMENT"
 
         response = GsiOnlineResponse(
             word_descriptions.get(word.wi, ""),
             cmd,
             answer,
-            value,
+            success,
             comment
         )
         self._logger.debug(response)
@@ -344,14 +346,14 @@ class GsiOnlineDNA(GsiOnlineType):
             answer = _UNKNOWNERROR
             comment = "EXCHANGE"
 
-        success = bool(self._GSIPAT.match(answer))
+        success = not comment and bool(self._GSIPAT.match(answer))
         value: _G | None = None
         if success:
             try:
                 value = wordtype.parse(answer.lstrip("*"))
             except Exception:
                 comment = "PARSE"
-        else:
+        elif not comment:
             comment = "INSTRUMENT"
 
         response = GsiOnlineResponse(
@@ -19,6 +19,7 @@ scaler "units" (no feet, no angle).
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import math
 from re import compile, Pattern
 from datetime import datetime
 from enum import Enum
@@ -175,17 +176,15 @@ def format_gsi_word(
     if wordindex >= 1000 or wordindex < 0:
         raise ValueError(f"GSI word index out of range ({wordindex})")
 
-    meta = (
-        (str(indexcorr.value) if indexcorr is not None else ".")
-        + (str(inputtype.value) if inputtype is not None else ".")
-        + (str(unit.value) if unit is not None else ".")
-    )
-    wi = str(wordindex).ljust(3, ".")
-    sign = "-" if negative else "+"
     datalength = 16 if gsi16 else 8
-    data = data[-datalength:].zfill(datalength)
-
-    return wi + meta + sign + data + " "
+    return (
+        f"{wordindex:.<3d}"
+        f"{indexcorr.value if indexcorr is not None else '.'}"
+        f"{inputtype.value if inputtype is not None else '.'}"
+        f"{unit.value if unit is not None else '.'}"
+        f"{'-' if negative else '+'}"
+        f"{data[-datalength:].zfill(datalength)} "
+    )
 
 
 class GsiWord(ABC):
@@ -815,10 +814,7 @@ class GsiAngleWord(GsiValueWord):
         match unit:
             case GsiUnit.GON | GsiUnit.DEG:
                 data = float(f"{value[7:-6]}.{value[-6:-1]}")
-                if unit is GsiUnit.GON:
-                    data *= 360 / 400
-
-                angle = Angle(data, 'deg')
+                angle = Angle(data, 'gon' if unit is GsiUnit.GON else 'deg')
             case GsiUnit.DMS:
                 angle = Angle.from_dms(
                     f"{value[-9:-6]}-{value[-6:-4]}-{value[-4:-2]}."
@@ -826,7 +822,7 @@ class GsiAngleWord(GsiValueWord):
                 )
             case GsiUnit.MIL:
                 data = float(f"{value[7:-5]}.{value[-5:-1]}")
-                angle = Angle(data * 360 / 6400, 'deg')
+                angle = Angle(data / 3200 * math.pi)
             case _:
                 raise ValueError(f"Invalid angle unit: '{unit}'")
 
@@ -866,16 +862,15 @@ class GsiAngleWord(GsiValueWord):
         """
         match angleunit:
             case GsiUnit.DEG | GsiUnit.GON:
-                value = self.value.normalized().asunit('deg')
-                if angleunit is GsiUnit.GON:
-                    value *= 400 / 360
-
+                value = self.value.normalized().asunit(
+                    'gon' if angleunit is GsiUnit.GON else 'deg'
+                )
                 data = f"{value:.5f}".replace(".", "")
             case GsiUnit.DMS:
                 dms = self.value.normalized().to_dms(1)
                 data = dms.replace("-", "").replace(".", "")
             case GsiUnit.MIL:
-                value = self.value.normalized().asunit('deg') * 6400 / 360
+                value = float(self.value.normalized()) / math.pi * 3200
                 data = f"{value:.4f}".replace(".", "")
 
             case _:
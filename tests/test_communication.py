@@ -1,5 +1,7 @@
 from os import environ
 import socket
+from threading import Event, Thread
+from time import monotonic
 
 import pytest
 from serial import Serial
@@ -10,7 +12,8 @@ from geocompy.communication import (
     SerialConnection,
     SocketConnection,
     crc16_bitwise,
-    crc16_bytewise
+    crc16_bytewise,
+    _FrameAccumulator
 )
 
 
@@ -91,6 +94,14 @@ class TestSocketConnection:
 
             assert soc.exchange_binary(b"00\r\n") == b"00"
 
+            assert soc.exchange_pipelined(["p1", "p2\r\n", "p3"]) == [
+                "p1", "p2", "p3"
+            ]
+            assert soc.exchange_pipelined([]) == []
+
+            with pytest.raises(UnicodeEncodeError):
+                soc.send("non-ascii: \u00e9")
+
             soc.reset()
 
         with pytest.raises(ConnectionError):
@@ -141,6 +152,14 @@ class TestSerialConnection:
         with open_serial(portname) as com:
             assert com.is_open()
 
+        with open_serial(portname, low_latency=True) as com:
+            assert com.is_open()
+
+        with open_serial(portname, eom=b"\r\n", eoa=b"\r\n") as com:
+            assert com.eom == "\r\n"
+            assert com.eoabytes == b"\r\n"
+            assert com.exchange("bytes") == "bytes"
+
         with pytest.raises(Exception):
             open_serial(faultyportname, timeout=1)
 
@@ -154,6 +173,17 @@ class TestSerialConnection:
 
             assert com.exchange_binary(b"00\r\n") == b"00"
 
+            assert com.exchange_pipelined(["p1", "p2\r\n", "p3"]) == [
+                "p1", "p2", "p3"
+            ]
+            assert com.exchange_pipelined([]) == []
+            assert com.exchange_pipelined(
+                f"g{i:d}" for i in range(2)
+            ) == ["g0", "g1"]
+
+            with pytest.raises(UnicodeEncodeError):
+                com.send("non-ascii: \u00e9")
+
             com.reset()
 
         with pytest.raises(ConnectionError):
@@ -183,6 +213,42 @@ class TestSerialConnection:
 
                 assert com._timeout_counter == 2
 
+    def test_trickle_timeout(self) -> None:
+        with open_serial(portname, timeout=1) as com:
+            stop = Event()
+
+            def trickle() -> None:
+                # The echo server returns every byte, but the answer
+                # never gets terminated.
+                while not stop.wait(0.3):
+                    com._port.write(b"x")
+
+            writer = Thread(target=trickle)
+            writer.start()
+            try:
+                start = monotonic()
+                with pytest.raises(TimeoutError):
+                    com.receive()
+
+                assert monotonic() - start < 3
+            finally:
+                stop.set()
+                writer.join()
+
+
+class TestFrameAccumulator:
+    def test_feed(self) -> None:
+        frames = _FrameAccumulator(b"\r\n")
+        assert frames.feed(b"abc") == []
+        assert frames.feed(b"\r") == []
+        assert frames.feed(b"\nde\r\nf\r\ng") == [b"abc", b"de", b"f"]
+        assert frames.feed(b"\r\n") == [b"g"]
+        assert frames.feed(b"\r\n") == [b""]
+
+        frames.feed(b"partial")
+        frames.clear()
+        assert frames.feed(b"h\r\n") == [b"h"]
+
 
 class TestCrc:
     def test_crc(self) -> None:
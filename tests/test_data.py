@@ -1,5 +1,5 @@
 import math
-from enum import Enum
+from enum import Enum, StrEnum
 
 import pytest
 from pytest import approx
@@ -24,10 +24,16 @@ class B(Enum):
     MEMBER = 1
 
 
+class C(StrEnum):
+    MEMBER = "value"
+
+
 class TestFunctions:
     def test_toenum(self) -> None:
         assert get_enum(A, "MEMBER") is A.MEMBER
         assert get_enum(A, A.MEMBER) is A.MEMBER
+        assert get_enum(C, C.MEMBER) is C.MEMBER
+        assert get_enum(C, "MEMBER") is C.MEMBER
 
         with pytest.raises(KeyError):
             get_enum(A, "FAIL")
@@ -37,7 +43,11 @@ class TestFunctions:
 
     def test_enumparser(self) -> None:
         assert callable(get_enum_parser(A))
+        assert get_enum_parser(A) is get_enum_parser(A)
         assert get_enum_parser(A)("1") is A.MEMBER
+        assert get_enum_parser(A)("01") is A.MEMBER
+        with pytest.raises(ValueError):
+            get_enum_parser(A)("2")
 
     def test_parsestr(self) -> None:
         assert parse_string("value") == "value"
@@ -242,6 +252,18 @@ class TestAngle:
         with pytest.raises(ValueError):
             Angle.from_dms("A")
 
+        with pytest.raises(ValueError):
+            Angle.from_dms("12-30\n")
+
+        with pytest.raises(ValueError):
+            Angle.from_dms("5.\u0665")
+
+    def test_hash(self) -> None:
+        a1 = Angle(90, 'deg')
+        assert hash(a1) == hash(Angle(100, 'gon'))
+        assert hash(a1) == hash(float(a1))
+        assert len({a1, Angle(100, 'gon'), Angle(0)}) == 2
+
 
 class TestByte:
     def test_init(self) -> None:
@@ -260,6 +282,8 @@ class TestByte:
     def test_parse(self) -> None:
         assert int(Byte.parse("0C")) == 12
         assert int(Byte.parse("'0C'")) == 12
+        assert int(Byte.parse("'ff'")) == 255
+        assert int(Byte.parse("C")) == 12
 
 
 class TestVector:
@@ -278,6 +302,8 @@ class TestVector:
         assert v1 - v2 == Vector(0, -1, -2)
         assert v1 - 1 == Vector(0, 0, 0)
         assert isinstance(+v1, Vector)
+        assert type((v2 * 2).x) is float
+        assert type((v2 + True).x) is float
 
         assert v1 is not +v1
         assert v1 != "a"
@@ -335,10 +361,18 @@ class TestVector:
         x, y, z = v1
         assert v1.x == v1[0]
         assert v1.x == x
+        assert v1.z == v1[-1]
+        assert list(v1) == [1, 2, 3]
 
         with pytest.raises(ValueError):
             v1[3]
 
+        with pytest.raises(IndexError):
+            v1[-4]
+
+        with pytest.raises(ValueError):
+            v1[-4]
+
     def test_swizzle(self) -> None:
         v1 = Vector(1, 2, 3)
         assert v1.swizzle('z', 'y', 'x') == Vector(3, 2, 1)
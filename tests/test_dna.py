@@ -1,6 +1,7 @@
 import pytest
 
 from geocompy.gsi.dna import GsiOnlineDNA
+from geocompy.gsi import gsiformat as gsi
 
 from helpers_gsionline import (
     DummyGsiOnlineConnection,
@@ -10,6 +11,11 @@ from helpers_gsionline import (
 from helpers import FaultyConnection
 
 
+class ExchangeErrorConnection(FaultyConnection):
+    def exchange(self, value: str) -> str:
+        raise ConnectionError()
+
+
 @pytest.fixture
 def dna() -> GsiOnlineDNA:
     return GsiOnlineDNA(DummyGsiOnlineConnection())
@@ -39,3 +45,22 @@ class TestDNA:
 
     def test_getrequest(self, dna: GsiOnlineDNA) -> None:
         GsiOnlineTester.test_getrequest(dna)
+
+    def test_exchange_error(self, dna: GsiOnlineDNA) -> None:
+        dna._conn = ExchangeErrorConnection()
+
+        response1 = dna.confrequest(1, int)
+        assert response1.value is None
+        assert response1.comment == "EXCHANGE"
+
+        response2 = dna.getrequest("I", gsi.GsiPointNameWord)
+        assert response2.value is None
+        assert response2.comment == "EXCHANGE"
+
+        response3 = dna.setrequest(1, 1)
+        assert not response3.value
+        assert response3.comment == "EXCHANGE"
+
+        response4 = dna.putrequest(gsi.GsiPointNameWord("1"))
+        assert not response4.value
+        assert response4.comment == "EXCHANGE"
@@ -7,6 +7,7 @@ import pytest
 from geocompy.geo import GeoCom
 from geocompy.communication import Connection
 from geocompy.data import Byte
+from geocompy.geo.gcdata import EDMModeV1
 
 from helpers import faulty_parser, FaultyConnection
 
@@ -48,19 +49,14 @@ class DummyGeoComConnection(Connection):
         return b""
 
     def exchange(self, cmd: str) -> str:
-        if not self._CMD.match(cmd):
+        cmd_match = self._CMD.match(cmd)
+        if cmd_match is None:
             return "%R1P,0,0:2"
 
-        head, _ = cmd.split(":")
-        match head.split(","):
-            case [_, _, trid_str]:
-                pass
-            case _:
-                trid_str = "0"
+        trid_str = cmd_match.group("trid")
+        trid = int(trid_str[1:]) if trid_str is not None else 0
 
-        trid = int(trid_str)
-
-        if re.match(r"%R1Q,5008,\d+:", cmd):
+        if cmd_match.group("rpc") == "5008":
             return f"%R1P,0,{trid}:0,1996,'07','19','10','13','2f'"
 
         return f"%R1P,0,{trid}:0"
@@ -147,3 +143,9 @@ class TestGeoCom:
         )
         assert re.match(r"%R1Q,1,\d+:1,2.0", response.cmd)
         assert re.match(r"%R1P,0,\d+:0", response.response)
+
+    def test_enum_params(self, instrument: GeoCom) -> None:
+        assert EDMModeV1(0) is EDMModeV1.SINGLE_STANDARD
+
+        response = instrument.tmc.set_edm_mode_v1("SINGLE_EXACT")
+        assert re.match(r"%R1Q,2020,\d+:1", response.cmd)
@@ -74,6 +74,22 @@ word_table: list[
         None,
         False
     ),
+    (
+        GsiHorizontalAngleWord,
+        Angle(180, 'deg'),
+        "21...2+20000000 ",
+        GsiUnit.GON,
+        None,
+        False
+    ),
+    (
+        GsiHorizontalAngleWord,
+        Angle(180, 'deg'),
+        "21...5+32000000 ",
+        GsiUnit.MIL,
+        None,
+        False
+    ),
     (
         GsiSlopeDistanceWord,
         123123.456,